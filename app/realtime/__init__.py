@@ -6,20 +6,40 @@ which is derived from https://github.com/openai/openai-realtime-console
 import os
 import asyncio
 import inspect
+import logging
+import time
+import bisect
 import uuid
 import numpy as np
-import json
+import orjson
 import websockets
 from datetime import datetime
-from collections import defaultdict
-import base64
+from collections import OrderedDict
+
+try:
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
 from chainlit.logger import logger
 from chainlit.config import config
 
-import socket
+_dns_warmed = False
 
-socket.gethostbyname("localhost")
+
+async def _warm_dns():
+    """
+    Resolves "localhost" once per process, off the event loop, instead of
+    blocking at import time.
+    """
+    global _dns_warmed
+    if _dns_warmed:
+        return
+    try:
+        await asyncio.get_running_loop().getaddrinfo("localhost", None)
+    except OSError:
+        pass
+    _dns_warmed = True
 
 
 def float_to_16bit_pcm(float32_array):
@@ -28,8 +48,11 @@ def float_to_16bit_pcm(float32_array):
     :param float32_array: numpy array of float32
     :return: numpy array of int16
     """
-    int16_array = np.clip(float32_array, -1, 1) * 32767
-    return int16_array.astype(np.int16)
+    # Scale in place in a single temporary; a float32 scalar keeps float32 input
+    # from being widened to float64.
+    scaled = np.clip(float32_array, -1.0, 1.0)
+    np.multiply(scaled, np.float32(32767.0), out=scaled)
+    return scaled.astype(np.int16, copy=False)
 
 
 def base64_to_array_buffer(base64_string):
@@ -38,42 +61,104 @@ def base64_to_array_buffer(base64_string):
     :param base64_string: base64 encoded string
     :return: numpy array of uint8
     """
-    binary_data = base64.b64decode(base64_string)
+    binary_data = _b64.b64decode(base64_string, validate=False)
     return np.frombuffer(binary_data, dtype=np.uint8)
 
 
 def array_buffer_to_base64(array_buffer):
     """
     Converts a numpy array buffer to a base64 string.
-    :param array_buffer: numpy array
+    :param array_buffer: numpy array, or raw bytes-like PCM data
     :return: base64 encoded string
     """
+    if isinstance(array_buffer, (bytes, bytearray, memoryview)):
+        return _b64.b64encode(array_buffer).decode("ascii")
     if array_buffer.dtype == np.float32:
         array_buffer = float_to_16bit_pcm(array_buffer)
-    elif array_buffer.dtype == np.int16:
-        array_buffer = array_buffer.tobytes()
+    if array_buffer.flags["C_CONTIGUOUS"]:
+        array_buffer = memoryview(array_buffer).cast("B")
     else:
         array_buffer = array_buffer.tobytes()
 
-    return base64.b64encode(array_buffer).decode("utf-8")
+    return _b64.b64encode(array_buffer).decode("ascii")
+
+
+class AudioChunkBuffer:
+    """
+    Append-only PCM byte buffer kept as a list of chunks with their starting
+    byte offsets, so a range can be read without copying the whole buffer.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.offsets = []
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, chunk):
+        # bytes() takes a private copy of views into caller-owned memory
+        chunk = bytes(chunk)
+        if chunk:
+            self.offsets.append(self.size)
+            self.chunks.append(chunk)
+            self.size += len(chunk)
+
+    def slice(self, start, end):
+        """
+        Returns the bytes in [start, end), joining only the overlapping chunks.
+        :param start: start byte offset
+        :param end: end byte offset (exclusive)
+        :return: bytes
+        """
+        start = max(start, 0)
+        end = min(end, self.size)
+        if start >= end:
+            return b""
+        first = bisect.bisect_right(self.offsets, start) - 1
+        last = bisect.bisect_left(self.offsets, end) - 1
+        head_start = start - self.offsets[first]
+        tail_end = end - self.offsets[last]
+        if first == last:
+            return self.chunks[first][head_start:tail_end]
+        return b"".join(
+            [
+                memoryview(self.chunks[first])[head_start:],
+                *self.chunks[first + 1 : last],
+                memoryview(self.chunks[last])[:tail_end],
+            ]
+        )
+
+    def to_bytes(self):
+        return b"".join(self.chunks)
 
 
 class RealtimeEventHandler:
     def __init__(self):
-        self.event_handlers = defaultdict(list)
+        # event name -> (sync handlers, async handlers), split once on registration
+        self.event_handlers = {}
 
     def on(self, event_name, handler):
-        self.event_handlers[event_name].append(handler)
+        sync_handlers, async_handlers = self.event_handlers.get(event_name, ((), ()))
+        if inspect.iscoroutinefunction(handler):
+            async_handlers += (handler,)
+        else:
+            sync_handlers += (handler,)
+        self.event_handlers[event_name] = (sync_handlers, async_handlers)
 
     def clear_event_handlers(self):
-        self.event_handlers = defaultdict(list)
+        self.event_handlers = {}
 
     def dispatch(self, event_name, event):
-        for handler in self.event_handlers[event_name]:
-            if inspect.iscoroutinefunction(handler):
-                asyncio.create_task(handler(event))
-            else:
-                handler(event)
+        entry = self.event_handlers.get(event_name)
+        if entry is None:
+            return
+        sync_handlers, async_handlers = entry
+        for handler in sync_handlers:
+            handler(event)
+        for handler in async_handlers:
+            asyncio.create_task(handler(event))
 
     async def wait_for_next(self, event_name):
         future = asyncio.Future()
@@ -93,9 +178,16 @@ class RealtimeAPI(RealtimeEventHandler):
         api_key=None,
         api_version="2024-10-01-preview",
         deployment=None,
+        binary_audio=None,
     ):
         super().__init__()
         self.use_azure = os.getenv("USE_AZURE", "false").lower() == "true"
+        # Send/receive audio as raw PCM in binary frames ("<json header>\x00<pcm>")
+        # instead of base64 inside JSON. Only enable this for servers that
+        # support that framing; the default keeps the standard base64 protocol.
+        if binary_audio is None:
+            binary_audio = os.getenv("REALTIME_BINARY_AUDIO", "false").lower() == "true"
+        self.binary_audio = binary_audio
 
         if self.use_azure:
             self.url = url or os.getenv("AZURE_OPENAI_URL")
@@ -117,7 +209,8 @@ class RealtimeAPI(RealtimeEventHandler):
         return self.ws is not None
 
     def log(self, *args):
-        logger.debug(f"[Websocket/{datetime.utcnow().isoformat()}]", *args)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[Websocket/{datetime.utcnow().isoformat()}]", *args)
 
     async def connect(self, model="gpt-4o-realtime-preview-2024-10-01"):
         if self.is_connected():
@@ -138,6 +231,7 @@ class RealtimeAPI(RealtimeEventHandler):
                 },
             )
         else:
+            await _warm_dns()
             # logger.info(f"Connecting to OpenAI URL: {self.url}")
             self.ws = await websockets.connect(
                 f"{self.url}?model={model}",
@@ -152,14 +246,23 @@ class RealtimeAPI(RealtimeEventHandler):
 
     async def _receive_messages(self):
         async for message in self.ws:
-            event = json.loads(message)
+            if self.binary_audio and isinstance(message, bytes):
+                header, _, audio = message.partition(b"\x00")
+                event = orjson.loads(header)
+                event["delta"] = audio
+            else:
+                event = orjson.loads(message)
             if event["type"] == "error":
                 logger.error("ERROR", event)
             self.log("received:", event)
             self.dispatch(f"server.{event['type']}", event)
             self.dispatch("server.*", event)
 
-    async def send(self, event_name, data=None):
+    async def send(self, event_name, data=None, wire_data=None):
+        """
+        Sends a client event. If given, wire_data replaces data in the serialized
+        frame only (e.g. pre-serialized fragments); handlers always see data.
+        """
         if not self.is_connected():
             raise Exception("RealtimeAPI is not connected")
         data = data or {}
@@ -169,10 +272,18 @@ class RealtimeAPI(RealtimeEventHandler):
         self.dispatch(f"client.{event_name}", event)
         self.dispatch("client.*", event)
         self.log("sent:", event)
-        await self.ws.send(json.dumps(event))
+        if wire_data is not None:
+            event = {"event_id": event["event_id"], "type": event_name, **wire_data}
+        audio = event.get("audio")
+        if self.binary_audio and isinstance(audio, (bytes, bytearray, memoryview)):
+            header = {key: value for key, value in event.items() if key != "audio"}
+            await self.ws.send(orjson.dumps(header) + b"\x00" + bytes(audio))
+            return
+        # The realtime API expects text frames, so decode the serialized bytes
+        await self.ws.send(orjson.dumps(event).decode())
 
     def _generate_id(self, prefix):
-        return f"{prefix}{int(datetime.utcnow().timestamp() * 1000)}"
+        return f"{prefix}{time.time_ns() // 1_000_000}"
 
     async def disconnect(self):
         if self.ws:
@@ -183,96 +294,76 @@ class RealtimeAPI(RealtimeEventHandler):
 
 class RealtimeConversation:
     default_frequency = config.features.audio.sample_rate
-
-    EventProcessors = {
-        "conversation.item.created": lambda self, event: self._process_item_created(
-            event
-        ),
-        "conversation.item.truncated": lambda self, event: self._process_item_truncated(
-            event
-        ),
-        "conversation.item.deleted": lambda self, event: self._process_item_deleted(
-            event
-        ),
-        "conversation.item.input_audio_transcription.completed": lambda self, event: self._process_input_audio_transcription_completed(
-            event
-        ),
-        "input_audio_buffer.speech_started": lambda self, event: self._process_speech_started(
-            event
-        ),
-        "input_audio_buffer.speech_stopped": lambda self, event, input_audio_buffer: self._process_speech_stopped(
-            event, input_audio_buffer
-        ),
-        "response.created": lambda self, event: self._process_response_created(event),
-        "response.output_item.added": lambda self, event: self._process_output_item_added(
-            event
-        ),
-        "response.output_item.done": lambda self, event: self._process_output_item_done(
-            event
-        ),
-        "response.content_part.added": lambda self, event: self._process_content_part_added(
-            event
-        ),
-        "response.audio_transcript.delta": lambda self, event: self._process_audio_transcript_delta(
-            event
-        ),
-        "response.audio.delta": lambda self, event: self._process_audio_delta(event),
-        "response.text.delta": lambda self, event: self._process_text_delta(event),
-        "response.function_call_arguments.delta": lambda self, event: self._process_function_call_arguments_delta(
-            event
-        ),
-    }
+    # Entries whose conversation.item.created never arrives are evicted oldest-first
+    max_queued_items = 1024
 
     def __init__(self):
+        self.event_processors = {
+            "conversation.item.created": self._process_item_created,
+            "conversation.item.truncated": self._process_item_truncated,
+            "conversation.item.deleted": self._process_item_deleted,
+            "conversation.item.input_audio_transcription.completed": self._process_input_audio_transcription_completed,
+            "input_audio_buffer.speech_started": self._process_speech_started,
+            "input_audio_buffer.speech_stopped": self._process_speech_stopped,
+            "response.created": self._process_response_created,
+            "response.output_item.added": self._process_output_item_added,
+            "response.output_item.done": self._process_output_item_done,
+            "response.content_part.added": self._process_content_part_added,
+            "response.audio_transcript.delta": self._process_audio_transcript_delta,
+            "response.audio.delta": self._process_audio_delta,
+            "response.text.delta": self._process_text_delta,
+            "response.function_call_arguments.delta": self._process_function_call_arguments_delta,
+        }
         self.clear()
 
     def clear(self):
+        # Insertion-ordered, so it doubles as the ordered list of items
         self.item_lookup = {}
-        self.items = []
         self.response_lookup = {}
         self.responses = []
-        self.queued_speech_items = {}
-        self.queued_transcript_items = {}
+        self.queued_speech_items = OrderedDict()
+        self.queued_transcript_items = OrderedDict()
         self.queued_input_audio = None
 
     def queue_input_audio(self, input_audio):
         self.queued_input_audio = input_audio
 
+    def _queue_item(self, queue, item_id, value):
+        queue[item_id] = value
+        if len(queue) > self.max_queued_items:
+            queue.popitem(last=False)
+
     def process_event(self, event, *args):
-        event_processor = self.EventProcessors.get(event["type"])
+        event_processor = self.event_processors.get(event["type"])
         if not event_processor:
             raise Exception(f"Missing conversation event processor for {event['type']}")
-        return event_processor(self, event, *args)
+        return event_processor(event, *args)
 
     def get_item(self, id):
         return self.item_lookup.get(id)
 
     def get_items(self):
-        return self.items[:]
+        return list(self.item_lookup.values())
 
     def _process_item_created(self, event):
         item = event["item"]
         new_item = item.copy()
-        if new_item["id"] not in self.item_lookup:
-            self.item_lookup[new_item["id"]] = new_item
-            self.items.append(new_item)
-        new_item["formatted"] = {"audio": [], "text": "", "transcript": ""}
-        if new_item["id"] in self.queued_speech_items:
-            new_item["formatted"]["audio"] = self.queued_speech_items[new_item["id"]][
-                "audio"
-            ]
-            del self.queued_speech_items[new_item["id"]]
-        if "content" in new_item:
-            text_content = [
-                c for c in new_item["content"] if c["type"] in ["text", "input_text"]
-            ]
-            for content in text_content:
-                new_item["formatted"]["text"] += content["text"]
-        if new_item["id"] in self.queued_transcript_items:
-            new_item["formatted"]["transcript"] = self.queued_transcript_items[
-                new_item["id"]
-            ]["transcript"]
-            del self.queued_transcript_items[new_item["id"]]
+        item_id = new_item["id"]
+        if item_id not in self.item_lookup:
+            self.item_lookup[item_id] = new_item
+        new_item["formatted"] = {
+            "audio": self.queued_speech_items.pop(item_id, {}).get(
+                "audio", bytearray()
+            ),
+            "text": "".join(
+                c["text"]
+                for c in new_item.get("content", ())
+                if c["type"] in ("text", "input_text")
+            ),
+            "transcript": self.queued_transcript_items.pop(item_id, {}).get(
+                "transcript", ""
+            ),
+        }
         if new_item["type"] == "message":
             if new_item["role"] == "user":
                 new_item["status"] = "completed"
@@ -300,9 +391,10 @@ class RealtimeConversation:
         item = self.item_lookup.get(item_id)
         if not item:
             raise Exception(f'item.truncated: Item "{item_id}" not found')
-        end_index = (audio_end_ms * self.default_frequency) // 1000
+        # audio is accumulated as raw int16 PCM, so 2 bytes per sample
+        end_index_bytes = ((audio_end_ms * self.default_frequency) // 1000) * 2
         item["formatted"]["transcript"] = ""
-        item["formatted"]["audio"] = item["formatted"]["audio"][:end_index]
+        item["formatted"]["audio"] = item["formatted"]["audio"][:end_index_bytes]
         return item, None
 
     def _process_item_deleted(self, event):
@@ -311,7 +403,6 @@ class RealtimeConversation:
         if not item:
             raise Exception(f'item.deleted: Item "{item_id}" not found')
         del self.item_lookup[item["id"]]
-        self.items.remove(item)
         return item, None
 
     def _process_input_audio_transcription_completed(self, event):
@@ -321,7 +412,11 @@ class RealtimeConversation:
         formatted_transcript = transcript or " "
         item = self.item_lookup.get(item_id)
         if not item:
-            self.queued_transcript_items[item_id] = {"transcript": formatted_transcript}
+            self._queue_item(
+                self.queued_transcript_items,
+                item_id,
+                {"transcript": formatted_transcript},
+            )
             return None, None
         item["content"][content_index]["transcript"] = transcript
         item["formatted"]["transcript"] = formatted_transcript
@@ -330,7 +425,9 @@ class RealtimeConversation:
     def _process_speech_started(self, event):
         item_id = event["item_id"]
         audio_start_ms = event["audio_start_ms"]
-        self.queued_speech_items[item_id] = {"audio_start_ms": audio_start_ms}
+        self._queue_item(
+            self.queued_speech_items, item_id, {"audio_start_ms": audio_start_ms}
+        )
         return None, None
 
     def _process_speech_stopped(self, event, input_audio_buffer):
@@ -339,9 +436,10 @@ class RealtimeConversation:
         speech = self.queued_speech_items[item_id]
         speech["audio_end_ms"] = audio_end_ms
         if input_audio_buffer:
+            # The buffer holds int16 PCM, so 2 bytes per sample
             start_index = (speech["audio_start_ms"] * self.default_frequency) // 1000
             end_index = (speech["audio_end_ms"] * self.default_frequency) // 1000
-            speech["audio"] = input_audio_buffer[start_index:end_index]
+            speech["audio"] = input_audio_buffer.slice(start_index * 2, end_index * 2)
         return None, None
 
     def _process_response_created(self, event):
@@ -402,9 +500,12 @@ class RealtimeConversation:
         if not item:
             logger.debug(f'response.audio.delta: Item "{item_id}" not found')
             return None, None
-        array_buffer = base64_to_array_buffer(delta)
-        append_values = array_buffer.tobytes()
-        item["formatted"]["audio"] += [append_values]
+        if isinstance(delta, bytes):
+            # Already raw PCM when it arrived in a binary frame
+            append_values = delta
+        else:
+            append_values = _b64.b64decode(delta, validate=False)
+        item["formatted"]["audio"].extend(append_values)
         return item, {"audio": append_values}
 
     def _process_text_delta(self, event):
@@ -432,7 +533,7 @@ class RealtimeConversation:
 
 
 class RealtimeClient(RealtimeEventHandler):
-    def __init__(self, url=None, api_key=None):
+    def __init__(self, url=None, api_key=None, binary_audio=None):
         super().__init__()
         self.default_session_config = {
             "modalities": ["text", "audio"],
@@ -455,9 +556,13 @@ class RealtimeClient(RealtimeEventHandler):
             "prefix_padding_ms": 300,
             "silence_duration_ms": 200,
         }
+        # Window (in seconds) over which audio deltas are merged into a single
+        # "conversation.updated" event; text deltas are always sent immediately.
+        self.audio_delta_coalesce_interval = 0.02
         self.realtime = RealtimeAPI(
             url=url,
             api_key=api_key,
+            binary_audio=binary_audio,
         )
         self.conversation = RealtimeConversation()
         self._reset_config()
@@ -465,9 +570,16 @@ class RealtimeClient(RealtimeEventHandler):
 
     def _reset_config(self):
         self.session_created = False
+        self._session_created_event = asyncio.Event()
         self.tools = {}
+        self._tools_version = 0
+        self._cached_tools_version = None
+        self._cached_tools = None
+        self._cached_tools_json = None
         self.session_config = self.default_session_config.copy()
-        self.input_audio_buffer = bytearray()
+        self.input_audio_buffer = AudioChunkBuffer()
+        self._pending_audio_deltas = {}
+        self._audio_flush_handle = None
         return True
 
     def _add_api_event_handlers(self):
@@ -491,7 +603,7 @@ class RealtimeClient(RealtimeEventHandler):
             self._process_event,
         )
         self.realtime.on("server.response.audio_transcript.delta", self._process_event)
-        self.realtime.on("server.response.audio.delta", self._process_event)
+        self.realtime.on("server.response.audio.delta", self._on_audio_delta)
         self.realtime.on("server.response.text.delta", self._process_event)
         self.realtime.on(
             "server.response.function_call_arguments.delta", self._process_event
@@ -499,6 +611,8 @@ class RealtimeClient(RealtimeEventHandler):
         self.realtime.on("server.response.output_item.done", self._on_output_item_done)
 
     def _log_event(self, event):
+        if "realtime.event" not in self.event_handlers:
+            return
         realtime_event = {
             "time": datetime.utcnow().isoformat(),
             "source": "client" if event["type"].startswith("client.") else "server",
@@ -508,6 +622,7 @@ class RealtimeClient(RealtimeEventHandler):
 
     def _on_session_created(self, event):
         self.session_created = True
+        self._session_created_event.set()
 
     def _process_event(self, event, *args):
         item, delta = self.conversation.process_event(event, *args)
@@ -515,7 +630,37 @@ class RealtimeClient(RealtimeEventHandler):
             self.dispatch("conversation.updated", {"item": item, "delta": delta})
         return item, delta
 
+    def _on_audio_delta(self, event):
+        item, delta = self.conversation.process_event(event)
+        if not item:
+            return
+        pending = self._pending_audio_deltas.get(item["id"])
+        if pending is None:
+            self._pending_audio_deltas[item["id"]] = (item, bytearray(delta["audio"]))
+        else:
+            pending[1].extend(delta["audio"])
+        if self._audio_flush_handle is None:
+            self._audio_flush_handle = asyncio.get_running_loop().call_later(
+                self.audio_delta_coalesce_interval, self._flush_audio_deltas
+            )
+
+    def _flush_audio_deltas(self):
+        self._cancel_audio_flush()
+        pending, self._pending_audio_deltas = self._pending_audio_deltas, {}
+        for item, audio in pending.values():
+            self.dispatch(
+                "conversation.updated", {"item": item, "delta": {"audio": bytes(audio)}}
+            )
+
+    def _cancel_audio_flush(self):
+        if self._audio_flush_handle is not None:
+            self._audio_flush_handle.cancel()
+            self._audio_flush_handle = None
+
     def _on_speech_started(self, event):
+        # Audio still waiting to be flushed belongs to the interrupted response
+        self._cancel_audio_flush()
+        self._pending_audio_deltas = {}
         self._process_event(event)
         self.dispatch("conversation.interrupted", event)
 
@@ -529,6 +674,7 @@ class RealtimeClient(RealtimeEventHandler):
             self.dispatch("conversation.item.completed", {"item": item})
 
     async def _on_output_item_done(self, event):
+        self._flush_audio_deltas()
         item, delta = self._process_event(event)
         if item and item["status"] == "completed":
             self.dispatch("conversation.item.completed", {"item": item})
@@ -537,7 +683,7 @@ class RealtimeClient(RealtimeEventHandler):
 
     async def _call_tool(self, tool):
         try:
-            json_arguments = json.loads(tool["arguments"])
+            json_arguments = orjson.loads(tool["arguments"])
             tool_config = self.tools.get(tool["name"])
             if not tool_config:
                 raise Exception(f'Tool "{tool["name"]}" has not been added')
@@ -548,19 +694,20 @@ class RealtimeClient(RealtimeEventHandler):
                     "item": {
                         "type": "function_call_output",
                         "call_id": tool["call_id"],
-                        "output": json.dumps(result),
+                        "output": orjson.dumps(result).decode(),
                     }
                 },
             )
         except Exception as e:
-            logger.error(f"Tool call error: {json.dumps({"error": str(e)})}")
+            error_output = orjson.dumps({"error": str(e)}).decode()
+            logger.error("Tool call error: %s", error_output)
             await self.realtime.send(
                 "conversation.item.create",
                 {
                     "item": {
                         "type": "function_call_output",
                         "call_id": tool["call_id"],
-                        "output": json.dumps({"error": str(e)}),
+                        "output": error_output,
                     }
                 },
             )
@@ -586,12 +733,14 @@ class RealtimeClient(RealtimeEventHandler):
     async def wait_for_session_created(self):
         if not self.is_connected():
             raise Exception("Not connected, use .connect() first")
-        while not self.session_created:
-            await asyncio.sleep(0.001)
+        await self._session_created_event.wait()
         return True
 
     async def disconnect(self):
         self.session_created = False
+        self._session_created_event.clear()
+        self._cancel_audio_flush()
+        self._pending_audio_deltas = {}
         self.conversation.clear()
         if self.realtime.is_connected():
             await self.realtime.disconnect()
@@ -610,6 +759,7 @@ class RealtimeClient(RealtimeEventHandler):
         if not callable(handler):
             raise Exception(f'Tool "{name}" handler must be a function')
         self.tools[name] = {"definition": definition, "handler": handler}
+        self._tools_version += 1
         await self.update_session()
         return self.tools[name]
 
@@ -617,6 +767,7 @@ class RealtimeClient(RealtimeEventHandler):
         if name not in self.tools:
             raise Exception(f'Tool "{name}" does not exist, can not be removed.')
         del self.tools[name]
+        self._tools_version += 1
         return True
 
     async def delete_item(self, id):
@@ -624,16 +775,31 @@ class RealtimeClient(RealtimeEventHandler):
         return True
 
     async def update_session(self, **kwargs):
+        if "tools" in kwargs:
+            self._tools_version += 1
         self.session_config.update(kwargs)
-        use_tools = [
-            {**tool_definition, "type": "function"}
-            for tool_definition in self.session_config.get("tools", [])
-        ] + [
-            {**self.tools[key]["definition"], "type": "function"} for key in self.tools
-        ]
-        session = {**self.session_config, "tools": use_tools}
+        if self._cached_tools_version != self._tools_version:
+            use_tools = [
+                {**tool_definition, "type": "function"}
+                for tool_definition in self.session_config.get("tools", [])
+            ] + [
+                {**self.tools[key]["definition"], "type": "function"}
+                for key in self.tools
+            ]
+            # Embedded verbatim by orjson, so the tools block is only serialized
+            # again when the tool set changes
+            self._cached_tools = use_tools
+            self._cached_tools_json = orjson.Fragment(orjson.dumps(use_tools))
+            self._cached_tools_version = self._tools_version
+        session = {**self.session_config, "tools": self._cached_tools}
         if self.realtime.is_connected():
-            await self.realtime.send("session.update", {"session": session})
+            await self.realtime.send(
+                "session.update",
+                {"session": session},
+                wire_data={
+                    "session": {**session, "tools": self._cached_tools_json}
+                },
+            )
         return True
 
     async def create_conversation_item(self, item):
@@ -643,7 +809,9 @@ class RealtimeClient(RealtimeEventHandler):
         if content:
             for c in content:
                 if c["type"] == "input_audio":
-                    if isinstance(c["audio"], (bytes, bytearray)):
+                    if isinstance(
+                        c["audio"], (bytes, bytearray, memoryview, np.ndarray)
+                    ):
                         c["audio"] = array_buffer_to_base64(c["audio"])
             await self.realtime.send(
                 "conversation.item.create",
@@ -660,20 +828,29 @@ class RealtimeClient(RealtimeEventHandler):
 
     async def append_input_audio(self, array_buffer):
         if len(array_buffer) > 0:
+            if isinstance(array_buffer, np.ndarray):
+                # Buffer and send the same int16 PCM, as a flat byte view
+                if array_buffer.dtype == np.float32:
+                    array_buffer = float_to_16bit_pcm(array_buffer)
+                array_buffer = memoryview(np.ascontiguousarray(array_buffer)).cast("B")
             await self.realtime.send(
                 "input_audio_buffer.append",
                 {
-                    "audio": array_buffer_to_base64(np.array(array_buffer)),
+                    "audio": (
+                        array_buffer
+                        if self.realtime.binary_audio
+                        else array_buffer_to_base64(array_buffer)
+                    ),
                 },
             )
-            self.input_audio_buffer.extend(array_buffer)
+            self.input_audio_buffer.append(array_buffer)
         return True
 
     async def create_response(self):
         if self.get_turn_detection_type() is None and len(self.input_audio_buffer) > 0:
             await self.realtime.send("input_audio_buffer.commit")
-            self.conversation.queue_input_audio(self.input_audio_buffer)
-            self.input_audio_buffer = bytearray()
+            self.conversation.queue_input_audio(self.input_audio_buffer.to_bytes())
+            self.input_audio_buffer = AudioChunkBuffer()
         await self.realtime.send("response.create")
         return True
 